@@ -3,7 +3,7 @@ import sys
 
 from .bar import Bar, BarConfig
 from .cli import ArgParser, CLIUsageError
-from .constants import CONFIG_FILE
+from .constants import CONFIG_FILE_ABS
 
 
 def main() -> None:
@@ -15,8 +15,14 @@ def main() -> None:
         except CLIUsageError as e:
             parser.error(e.msg)  # Shows usage
 
-        file = command_options.pop('config_file', CONFIG_FILE)
-        absolute = os.path.abspath(os.path.expanduser(file))
+        file = command_options.pop('config_file', None)
+        if file is None:
+            absolute = CONFIG_FILE_ABS
+        else:
+            # Only look up the home directory when the path needs it:
+            if file.startswith('~'):
+                file = os.path.expanduser(file)
+            absolute = os.path.abspath(file)
 
         try:
             config = BarConfig.from_file(absolute, overrides=bar_options)
@@ -62,6 +62,13 @@ from typing import (
 )
 
 
+# Every top-level config option that is not a loose Field definition.
+# Union the key sets once instead of in every call:
+_BAR_CONFIG_PARAMS = (
+    BarConfigSpec.__optional_keys__ | BarConfigSpec.__required_keys__
+)
+
+
 class BarConfig(dict):
     '''
     Build and transport configs between files, dicts and command lines.
@@ -167,13 +174,9 @@ class BarConfig(dict):
         :returns: The processed config
         :rtype: :class:`namespaces.BarConfigSpec`
         '''
-        all_except_defs = (
-            BarConfigSpec.__optional_keys__
-            | BarConfigSpec.__required_keys__
-        )
         defs = self.pop('field_definitions', {})
         for param in tuple(self):
-            if param not in all_except_defs:
+            if param not in _BAR_CONFIG_PARAMS:
                 field_def = self.pop(param)
                 if not isinstance(field_def, Mapping):
                     raise ValueError(
@@ -271,9 +274,11 @@ class BarConfig(dict):
             :class:`JSONText`]
         '''
         absolute = os.path.abspath(os.path.expanduser(file))
+        # Read the file once and parse that text; reading again after
+        # json.load() would only give an empty string:
         with open(absolute, 'r') as f:
-            from_file = json.load(f)
             text = f.read()
+        from_file = json.loads(text)
         data = cls._unify_field_defs(from_file)
         return data, text
 
@@ -291,7 +296,9 @@ class BarConfig(dict):
         if absolute == CONFIG_FILE and not os.path.exists(absolute):
             cli.FileManager._maybe_make_config_dir()
         with open(absolute, 'w') as f:
-            f.write(json.dumps(self, indent=indent) + '\n')
+            # Stream the JSON rather than building one big string first:
+            json.dump(self, f, indent=indent)
+            f.write('\n')
 
     def _remove_unserializable(self) -> Self:
         '''
@@ -317,7 +324,8 @@ class BarConfig(dict):
         '''
         Return a :class:`BarConfig` as a string with Scuff formatting.
         '''
-        scuffer = scuff.PyParser(unquoted=tuple(Field._default_fields))
+        default_names = tuple(Field._default_field_factories)
+        scuffer = scuff.PyParser(unquoted=default_names)
         return scuffer.to_scuff(self)
 
     def as_json(self, indent: int = 4) -> JSONText:
@@ -468,7 +476,11 @@ class Bar:
             # Good to use template:
             else:
                 parsed = FmtStrStructure.from_str(template)
-                parsed.validate_fields(Field._default_fields, True, True)
+                parsed.validate_fields(
+                    Field._default_field_factories,
+                    True,
+                    True
+                )
                 # names = parsed.get_names()
                 fields = parsed
 
@@ -523,10 +535,18 @@ class Bar:
         self._can_run = threading.Event()
         self._running = self._can_run.is_set
 
+        # Stopping the bar sets this Event, waking threaded fields that
+        # are waiting for their next cycle:
+        self._can_stop = threading.Event()
+
         # The bar's async event loop:
-        # self._thread_loop = asyncio.new_event_loop()
         self._loop = asyncio.new_event_loop()
 
+        # The event loop shared by threaded fields with async functions
+        # and the thread running it. These start only when needed:
+        self._thread_loop = None
+        self._thread_loop_thread = None
+
         self._file = None
         self._config = None
 
@@ -618,7 +638,7 @@ class Bar:
         :raises: :exc:`errors.DefaultFieldNotFoundError` when either
             a field in `field_order` or
             a field in `template`
-            cannot be found in :attr:`Field._default_fields`
+            cannot be found in :attr:`Field._default_field_factories`
         :raises: :exc:`errors.UndefinedFieldError` when
             a custom field name in `field_order` or
             a custom field name in `template`
@@ -655,7 +675,7 @@ class Bar:
                 )
         else:
             parsed = FmtStrStructure.from_str(template)
-            parsed.validate_fields(Field._default_fields, True, True)
+            parsed.validate_fields(Field._default_field_factories, True, True)
             field_order = parsed.get_names()
 
         # Gather Field parameters and instantiate new Fields:
@@ -997,6 +1017,7 @@ class Bar:
                 self._loop = asyncio.new_event_loop()
 
             self._prepare_fields()
+            self._can_stop.clear()
             self._can_run.set()
             for thread in tuple(self._threads.values()):
                 thread.start()
@@ -1014,6 +1035,7 @@ class Bar:
                     time.sleep(self._thread_cooldown)
                 self._print_one_line()
                 self._can_run.clear()
+                self._can_stop.set()
 
             # Prevent the bar from exiting when there are no coroutines:
             while self._running():
@@ -1036,6 +1058,12 @@ class Bar:
                 thread = field.make_thread(bar=self, run_once=once)
                 self._threads[thread.name] = thread
             elif field.timely:
+                # Fix the icon and formatter for this stream once so the
+                # printer doesn't branch on them every refresh:
+                field._resolve_icon()
+                # Timely fields never call run(), so finish any async
+                # setup here while the bar's loop is idle:
+                field._do_setup(loop=self._loop)
                 self._timely_fields.append(field)
             else:
                 self._coros[field.name] = field.run(bar=self, once=once)
@@ -1062,14 +1090,7 @@ class Bar:
             else:
                 result = f._func(*f.args, **f.kwargs)
 
-            if f.template is not None:
-                contents = f.template.format(result, icon=f.icon)
-            else:
-                if f.always_show_icon or result:
-                    contents = f.icon + result
-                else:
-                    contents = result
-            self._buffers[f.name] = contents
+            self._buffers[f.name] = f._format(result)
 
     def _start_printer(self) -> None:
         '''
@@ -1084,6 +1105,33 @@ class Bar:
         self._threads[thread_name] = self._printer_thread
         self._printer_thread.start()
 
+    def _get_thread_loop(self) -> asyncio.AbstractEventLoop:
+        '''
+        Return the event loop in which threaded fields run their async
+        functions, starting it in a new thread on first use.
+        '''
+        if self._thread_loop is None:
+            self._thread_loop = asyncio.new_event_loop()
+            self._thread_loop_thread = threading.Thread(
+                target=self._thread_loop.run_forever,
+                name='THREAD_LOOP',
+                daemon=True,
+            )
+            self._thread_loop_thread.start()
+        return self._thread_loop
+
+    def _stop_thread_loop(self) -> None:
+        '''
+        Stop and close the event loop shared by threaded fields, if any.
+        '''
+        if self._thread_loop is None:
+            return
+        self._thread_loop.call_soon_threadsafe(self._thread_loop.stop)
+        self._thread_loop_thread.join()
+        self._thread_loop.close()
+        self._thread_loop = None
+        self._thread_loop_thread = None
+
     def _threaded_continuous_line_printer(self) -> None:
         '''
         The bar's primary line-printing mechanism.
@@ -1162,14 +1210,7 @@ class Bar:
                 else:
                     result = f._func(*f.args, **f.kwargs)
 
-                if f.template is not None:
-                    contents = f.template.format(result, icon=f.icon)
-                else:
-                    if f.always_show_icon or result:
-                        contents = f.icon + result
-                    else:
-                        contents = result
-                self._buffers[f.name] = contents
+                self._buffers[f.name] = f._format(result)
 
             if using_format_str:
                 line = self.template.format_map(self._buffers)
@@ -1187,6 +1228,7 @@ class Bar:
                 self._print_countdown -= 1
                 if self._print_countdown == 0:
                     self._can_run.clear()
+                    self._can_stop.set()
                     self._printer_loop.stop()
                     self._printer_loop.close()
                     return
@@ -1201,11 +1243,13 @@ class Bar:
         running in a terminal.
         '''
         self._can_run.clear()
+        self._can_stop.set()
 
         threads = tuple(self._threads.items())
         for thread_name, thread in threads:
             thread.join()
             self._threads.pop(thread_name)
+        self._stop_thread_loop()
 
         if self.in_a_tty:
             self._stream.write('\n')
@@ -10,7 +10,7 @@ from enum import Enum
 from os import PathLike
 
 from . import __version__
-from .constants import CONFIG_FILE
+from .constants import CONFIG_FILE, CONFIG_FILE_ABS
 from .errors import CLIUsageError
 from .namespaces import BarConfigSpec, _CmdOptionSpec, FieldConfigSpec
 from .utils import str_to_bool
@@ -27,6 +27,27 @@ from typing import Any, Callable, Iterable, Never, TypeAliasType
 PROG = __package__
 
 
+def _make_field_option_conversions() -> dict[str, Callable[[str], Any]]:
+    '''
+    Map each :class:`FieldConfigSpec` key to the callable which converts
+    its command line string to the right type.
+    '''
+    conversion_map = {}
+    for param, typ in FieldConfigSpec.__annotations__.items():
+        if typ is bool:
+            conversion = str_to_bool
+        elif type(typ) is TypeAliasType:
+            conversion = typ.__value__
+        else:
+            conversion = typ
+        conversion_map[param] = conversion
+    return conversion_map
+
+
+# The annotations never change, so dispatch on their types only once:
+_FIELD_OPTION_CONVERSIONS = _make_field_option_conversions()
+
+
 class ArgFormatter:
     '''
     Methods for formatting args.
@@ -172,8 +193,7 @@ class ArgParser(ArgumentParser):
                     # An option for a Field.
                     # Handle attribute access through dots:
                     field_name, field_opt = field_and_opt.split('.', 1)
-                    if field_name not in field_definitions:
-                        field_definitions[field_name] = {}
+                    field_def = field_definitions.setdefault(field_name, {})
 
                     if val in ('""', "''"):
                         # Looks like "key=''" | 'key=""'
@@ -207,23 +227,16 @@ class ArgParser(ArgumentParser):
                             msg = f"{opt !r} is invalid option syntax."
                             raise CLIUsageError(msg)
 
-                    field_definitions[field_name].update({field_opt: val})
+                    field_def[field_opt] = val
 
         # Convert values from strings:
-        conversion_map = {}
-        for param, typ in FieldConfigSpec.__annotations__.items():
-            if typ is bool:
-                conversion = str_to_bool
-            elif type(typ) is TypeAliasType:
-                conversion = typ.__value__
-            else:
-                conversion = typ
-            conversion_map[param] = conversion
-
-        for field, params in field_definitions.items():
+        conversion_map = _FIELD_OPTION_CONVERSIONS
+        for params in field_definitions.values():
             for k, v in params.items():
-                if k in conversion_map:
-                    field_definitions[field][k] = conversion_map[k](v)
+                # Look up each conversion only once:
+                conversion = conversion_map.get(k)
+                if conversion is not None:
+                    params[k] = conversion(v)
 
         return field_definitions
 
@@ -548,8 +561,7 @@ class FileManager:
         '''
         question = f"Would you like to write a new config file at {file!r}?"
 
-        absolute = os.path.abspath(os.path.expanduser(CONFIG_FILE))
-        if not os.path.exists(absolute):
+        if not os.path.exists(CONFIG_FILE_ABS):
             maybe_default = ' '
             if file == CONFIG_FILE:
                 welcome_new_users()
@@ -573,8 +585,7 @@ class FileManager:
         '''
         Make a '.config' directory if nonexistent.
         '''
-        absolute = os.path.abspath(os.path.expanduser(CONFIG_FILE))
-        directory = os.path.dirname(absolute)
+        directory = os.path.dirname(CONFIG_FILE_ABS)
         if not os.path.exists(directory):
             os.mkdir(directory)
             print(f"Made new directory {directory!r}")
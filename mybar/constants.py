@@ -1,5 +1,6 @@
 __all__ = (
     'CONFIG_FILE',
+    'CONFIG_FILE_ABS',
     'DEBUG',
     'CSI',
     'CLEAR_LINE',
@@ -20,6 +21,9 @@ CONFIG_FILE: str = (
 )
 '''The default mybar config file path.'''
 
+CONFIG_FILE_ABS: str = os.path.abspath(os.path.expanduser(CONFIG_FILE))
+'''The absolute path of :obj:`CONFIG_FILE`.'''
+
 DEBUG: bool = False
 '''The default debug state.'''
 
@@ -79,7 +79,8 @@ class UndefinedFieldError(LookupError):
     '''
     Raised if, when parsing a config file, a field name appears in the
     `field_order` item of the :class:`dict` passed to :meth:`Bar.from_dict()` that is neither
-    found in its `field_definitions` parameter nor in :attr:`Field._default_fields`.
+    found in its `field_definitions` parameter nor in
+    :attr:`Field._default_field_factories`.
     '''
     pass
 
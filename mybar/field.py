@@ -14,6 +14,8 @@ import shlex
 import threading
 import time
 from os import PathLike
+from string import Formatter
+from types import MappingProxyType
 
 from . import field_funcs
 from . import _setups
@@ -35,13 +37,18 @@ from ._types import (
     Unicode_Icon,
 )
 
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from typing import (
     Never,
     Self,
 )
 
 
+# Deadlines are kept in integer nanoseconds so that they never
+# accumulate float rounding error, however long a bar runs:
+_NS_PER_SEC = 1_000_000_000
+
+
 class Field:
     '''
     Continuously generate and format one bit of information in a
@@ -141,15 +148,17 @@ class Field:
     :raises: :exc:`TypeError` when `func` is not callable
     :raises: :exc:`TypeError` when `setup`, if given, is not callable
     '''
-    _default_fields = {
+    # Default Field specs are built on first lookup and cached in
+    # :attr:`Field._default_field_cache` as read-only mappings:
+    _default_field_factories: dict[FieldName, Callable[[], FieldSpec]] = {
 
-        'hostname': {
+        'hostname': lambda: {
             'name': 'hostname',
             'func': field_funcs.get_hostname,
             'run_once': True
         },
 
-        'host': {
+        'host': lambda: {
             'name': 'host',
             'func': field_funcs.get_host,
             'kwargs': {
@@ -158,7 +167,7 @@ class Field:
             'run_once': True
         },
 
-        'uptime': {
+        'uptime': lambda: {
             'name': 'uptime',
             'func': field_funcs.get_uptime,
             'kwargs': {
@@ -172,7 +181,7 @@ class Field:
             'icon': 'Up ',
         },
 
-        'cpu_usage': {
+        'cpu_usage': lambda: {
             'name': 'cpu_usage',
             'func': field_funcs.get_cpu_usage,
             'kwargs': {
@@ -183,7 +192,7 @@ class Field:
             'icon': 'CPU ',
         },
 
-        'cpu_temp': {
+        'cpu_temp': lambda: {
             'name': 'cpu_temp',
             'func': field_funcs.get_cpu_temp,
             'kwargs': {
@@ -193,7 +202,7 @@ class Field:
             'threaded': True,
         },
 
-        'mem_usage': {
+        'mem_usage': lambda: {
             'name': 'mem_usage',
             'func': field_funcs.get_mem_usage,
             'kwargs': {
@@ -204,7 +213,7 @@ class Field:
             'icon': 'Mem ',
         },
 
-        'disk_usage': {
+        'disk_usage': lambda: {
             'name': 'disk_usage',
             'func': field_funcs.get_disk_usage,
             'kwargs': {
@@ -216,7 +225,7 @@ class Field:
             'icon': '/:',
         },
 
-        'battery': {
+        'battery': lambda: {
             'name': 'battery',
             'kwargs': {
                 'fmt': "{pct:02.0f}{state}",
@@ -226,7 +235,7 @@ class Field:
             'icon': 'Bat ',
         },
 
-        'net_stats': {
+        'net_stats': lambda: {
             'name': 'net_stats',
             'func': field_funcs.get_net_stats,
             'kwargs': {
@@ -239,7 +248,7 @@ class Field:
             'interval': 5,
         },
 
-        'datetime': {
+        'datetime': lambda: {
             'name': 'datetime',
             'func': field_funcs.get_datetime,
             'kwargs': {
@@ -250,6 +259,7 @@ class Field:
         }
 
     }
+    _default_field_cache: dict[FieldName, Mapping] = {}
 
     def __init__(
         self,
@@ -302,7 +312,9 @@ class Field:
         self.name = name
         self._func = func
         self.args = () if args is None else args
-        self.kwargs = {} if kwargs is None else kwargs
+        # Setup functions add to `kwargs`, so never alias the mapping
+        # given, which may be a read-only default:
+        self.kwargs = {} if kwargs is None else dict(kwargs)
 
         if setup is not None and not callable(setup):
             # `setup` was given but is of the wrong type.
@@ -310,6 +322,9 @@ class Field:
                 f"Type of 'setup' must be callable, not {type(setup)}"
             )
         self._setupfunc = setup
+        self._setup_is_async = (
+            setup is not None and asyncio.iscoroutinefunction(setup)
+        )
 
         if isinstance(icon, str):
             icon = (icon, icon)
@@ -325,17 +340,24 @@ class Field:
             )
         self.template = template
 
+        # Simple templates can skip str.format() altogether:
+        pieces = self._split_template(template)
+        self._fast_format = (pieces is not None)
+        if self._fast_format:
+            (
+                self._tmpl_prefix,
+                self._tmpl_middle,
+                self._tmpl_suffix
+            ) = pieces
+
         self.is_async = asyncio.iscoroutinefunction(func)
-        if self.is_async or threaded or timely:
-            self._callback = func
-        else:
-            # Wrap synchronous functions if they aren't special:
-            self._callback = self._asyncify
 
         self.allow_multiline = allow_multiline
         self.always_show_icon = always_show_icon
         self._bar = bar
         self._buffer = None
+        self._resolved_icon = None
+        self._handle = None
         self.clock_align = clock_align
         self.command = command
         self.constant_output = constant_output
@@ -346,7 +368,12 @@ class Field:
         self.threaded = threaded
         self.timely = timely
 
-        self._do_setup()
+        self._resolve_icon()
+        # Run a synchronous setup now, but leave async setups for
+        # run() so that making a Field never starts an event loop:
+        self._setup_done = False
+        self._do_setup(defer_async=True)
+        self._eq_key = self._make_eq_key()
 
     def __repr__(self) -> str:
         cls = type(self).__name__
@@ -355,28 +382,41 @@ class Field:
         return f"{cls}({name=})"
 
     def __eq__(self, other: Self) -> bool:
-        if not all(
-            getattr(self, attr) == getattr(other, attr)
-            for attr in (
-                'clock_align',
-                'always_show_icon',
-                'constant_output',
-                'template',
-                '_icons',
-            )
-        ):
+        if not isinstance(other, Field):
+            return NotImplemented
+        if self._eq_key != other._eq_key:
+            return False
+        # A setup can change these after __init__(), so compare them
+        # as they are now:
+        if self.constant_output != other.constant_output:
             return False
+        return self._func is None or self.kwargs == other.kwargs
+
+    def __hash__(self) -> int:
+        # Values in `args` and `kwargs` may be unhashable, so leave them
+        # out. Equal Fields still get equal hashes.
+        return hash(self._eq_key[0])
 
+    def _make_eq_key(self) -> tuple[tuple, tuple]:
+        '''
+        Gather the parameters that make two Fields equal and that never
+        change after :meth:`Field.__init__` into one tuple so that
+        :meth:`Field.__eq__` and :meth:`Field.__hash__` need only a
+        single comparison for them.
+        `constant_output` and `kwargs` are left out, since a setup may
+        still change them.
+        '''
+        params = (
+            self.clock_align,
+            self.always_show_icon,
+            self.template,
+            tuple(self._icons),
+            self._func,
+        )
         if self._func is None:
-            if self.constant_output == other.constant_output:
-                return True
-        elif (
-            self._func is other._func
-            and self.args == other.args
-            and self.kwargs == other.kwargs
-        ):
-            return True
-        return False
+            # Fields with constant output ignore `args` and `kwargs`.
+            return (params, ())
+        return (params, tuple(self.args))
 
     @classmethod
     def from_default(
@@ -396,7 +436,7 @@ class Field:
         :type overrides: :class:`namespaces.FieldSpec`, optional
 
         :param source: The :class:`dict` in which to look up default fields,
-            defaults to :attr:`Field._default_fields`
+            defaults to :attr:`Field._default_field_factories`
         :type source: :class:`Mapping[FieldName, namespaces.FieldSpec]`
 
         :returns: A new :class:`Field`
@@ -404,25 +444,53 @@ class Field:
         :raises: :exc:`errors.DefaultFieldNotFoundError` when `source` does not contain `name`
         '''
         if source is None:
-            source = cls._default_fields
-
-        try:
-            default: FieldSpec = source[name].copy()
-        except KeyError:
-            raise DefaultFieldNotFoundError(
-                f"{name!r} is not the name of a default Field."
-            ) from None
-
-        if overrides.get('interval', None) != default.get('interval', None):
-            overrides['timely'] = False
-        if 'kwargs' in overrides and 'kwargs' in default:
-            overrides['kwargs'] = default['kwargs'] | overrides['kwargs']
+            default = cls._default_field_cache.get(name)
+            if default is None:
+                try:
+                    factory = cls._default_field_factories[name]
+                except KeyError:
+                    raise DefaultFieldNotFoundError(
+                        f"{name!r} is not the name of a default Field."
+                    ) from None
+                default = cls._default_field_cache.setdefault(
+                    name,
+                    cls._freeze_spec(factory())
+                )
+        else:
+            try:
+                default: FieldSpec = source[name]
+            except KeyError:
+                raise DefaultFieldNotFoundError(
+                    f"{name!r} is not the name of a default Field."
+                ) from None
+
+        if not overrides:
+            # The common case needs no merge, so skip copying `default`.
+            # Cached defaults are read-only, so sharing them is safe.
+            spec = default
+        else:
+            overrides = dict(overrides)
+            interval = overrides.get('interval', None)
+            if interval != default.get('interval', None):
+                overrides['timely'] = False
+            if 'kwargs' in overrides and 'kwargs' in default:
+                overrides['kwargs'] = default['kwargs'] | overrides['kwargs']
+            spec = default | overrides
 
-        spec = default | overrides
         field = cls(**spec)
         field._fmt_sig = fmt_sig
         return field
 
+    @staticmethod
+    def _freeze_spec(spec: FieldSpec) -> Mapping:
+        '''
+        Make a read-only view of a default Field spec and its `kwargs`
+        so that the cached spec can be shared without being copied.
+        '''
+        if 'kwargs' in spec:
+            spec['kwargs'] = MappingProxyType(spec['kwargs'])
+        return MappingProxyType(spec)
+
     @classmethod
     def from_format_string(cls, fmt: FormatStr) -> Self:
         '''
@@ -447,9 +515,79 @@ class Field:
         unicode = self._bar._unicode or not self._bar._stream.isatty()
         return self._icons[unicode]
 
-    async def _asyncify(self, *args, **kwargs) -> Contents:
-        '''Wrap a synchronous function in a coroutine for simplicity.'''
-        return self._func(*args, **kwargs)
+    def _resolve_icon(self) -> str:
+        '''
+        Look up :attr:`Field.icon` once and cache it.
+        The stream of a running bar does not change, so the main loops
+        of :meth:`Field.run` and :meth:`Field.run_threaded` use this
+        instead of calling :meth:`isatty()` every cycle.
+        '''
+        self._resolved_icon = self.icon
+        self._format = self._make_formatter()
+        return self._resolved_icon
+
+    def _make_formatter(self) -> Callable[[str], Contents]:
+        '''
+        Decide once how to format Field contents and return a function
+        that does only that, so the main loops need not check
+        `template` and `always_show_icon` every cycle.
+        This uses the icon cached by :meth:`Field._resolve_icon`.
+        '''
+        icon = self._resolved_icon
+        if self._fast_format:
+            # Join the constant parts of the template only once:
+            head = self._tmpl_prefix + icon + self._tmpl_middle
+            tail = self._tmpl_suffix
+
+            def fast_format(text: Contents) -> str:
+                if type(text) is not str:
+                    # Match what str.format() would do with other types:
+                    text = format(text, '')
+                return head + text + tail
+            return fast_format
+        if self.template is not None:
+            fmt = self.template.format
+            return lambda text: fmt(text, icon=icon)
+        if self.always_show_icon:
+            return lambda text: icon + text
+        return lambda text: icon + text if text else text
+
+    @staticmethod
+    def _split_template(
+        template: FormatStr | None
+    ) -> tuple[str, str, str] | None:
+        '''
+        Split a template of the form ``'...{icon}...{}...'`` into the
+        literal text before, between and after its two fields.
+        Return ``None`` if `template` has any other fields, format specs
+        or conversions and must be formatted with :meth:`str.format`.
+
+        :param template: The template to split
+        :type template: :class:`FormatStr` | ``None``
+        '''
+        if template is None:
+            return None
+        try:
+            parsed = tuple(Formatter().parse(template))
+        except ValueError:
+            # Leave broken templates for str.format() to complain about.
+            return None
+
+        pieces = ['']
+        fnames = []
+        for lit, fname, spec, conversion in parsed:
+            pieces[-1] += lit
+            if fname is None:
+                # Escaped curly braces split the literal text.
+                continue
+            if spec or conversion is not None:
+                return None
+            fnames.append(fname)
+            pieces.append('')
+
+        if fnames != ['icon', '']:
+            return None
+        return tuple(pieces)
 
     def _fetch_script(self, script: PathLike) -> str:
         with open(script, 'r') as f:
@@ -469,50 +607,36 @@ class Field:
             result = ' '.join(result.splitlines())
         return result
 
-    @staticmethod
-    def _format_contents(
-        text: str,
-        icon: str,
-        template: FormatStr = None,
-        always_show_icon: bool = False
-    ) -> Contents:
-        '''A helper function that formats field contents.'''
-        if template is None:
-            if always_show_icon or text:
-                return icon + text
-            else:
-                return text
-        else:
-            return template.format(text, icon=icon)
-
-    def _auto_format(self, text: str) -> Contents:
-        '''Non-staticmethod _format_contents...'''
-        if self.template is None:
-            if self.always_show_icon or text:
-                return self.icon + text
-            else:
-                return text
-        else:
-            return self.template.format(text, icon=self.icon)
-
-    def _do_setup(self, args: Args = None, kwargs: Kwargs = None) -> None:
+    def _do_setup(
+        self,
+        loop: asyncio.AbstractEventLoop = None,
+        defer_async: bool = False
+    ) -> None:
         '''
         Use the pre-defined _setupfunc() to gather constant variables
         for func() which might only be evaluated at runtime.
+        The setup only ever runs once per Field.
+
+        :param loop: The event loop in which to run an async setup,
+            defaults to a new event loop that closes afterward
+        :type loop: :class:`asyncio.AbstractEventLoop`, optional
+
+        :param defer_async: Leave an async setup to be run later,
+            defaults to ``False``
+        :type defer_async: :class:`bool`
         '''
-        if self._setupfunc is None:
+        if self._setup_done or self._setupfunc is None:
+            return
+        if self._setup_is_async and defer_async:
             return
-
-        if args is None:
-            args = self.args
-        if kwargs is None:
-            kwargs = self.kwargs
 
         try:
-            if asyncio.iscoroutinefunction(self._setupfunc):
-                setupvars = asyncio.get_event_loop().run_until_complete(
-                    self._setupfunc(*self.args, **self.kwargs)
-                )
+            if self._setup_is_async:
+                setup = self._setupfunc(*self.args, **self.kwargs)
+                if loop is None:
+                    setupvars = asyncio.run(setup)
+                else:
+                    setupvars = loop.run_until_complete(setup)
             else:
                 setupvars = self._setupfunc(*self.args, **self.kwargs)
 
@@ -520,41 +644,35 @@ class Field:
         # use it as the field's new constant_output:
         except FailedSetup as e:
             backup = e.backup
-            self.constant_output = self._auto_format(backup)
+            self.constant_output = self._format(backup)
+            self._setup_done = True
             return
 
         # On success, give new values to kwargs to pass to _func().
-        # return setupvars
-        kwargs['setupvars'] = setupvars
+        self.kwargs['setupvars'] = setupvars
+        self._setup_done = True
 
     def sync_run(self, once: bool = None) -> Contents:
+        self._resolve_icon()
+        self._do_setup()
         # Do not run fields which have a constant output;
         # only set their bar buffer.
         if self.constant_output is not None:
-            return self._auto_format(self.constant_output)
+            return self._format(self.constant_output)
         if self.is_async:
-            result = asyncio.get_event_loop().run_until_complete(
-                self._func(*self.args, **self.kwargs)
-            )
+            result = asyncio.run(self._func(*self.args, **self.kwargs))
         else:
             result = self._func(*self.args, **self.kwargs)
-        contents = self._auto_format(result)
+        contents = self._format(result)
         return contents
 
-    def gen_run(self, once: bool = None) -> Contents:
-        # Do not run fields which have a constant output;
-        # only set their bar buffer.
-        if self.constant_output is not None:
-            return self._auto_format(self.constant_output)
-        while True:
-            if self.is_async:
-                result = self._func(*self.args, **self.kwargs)
-            else:
-                result = asyncio.get_event_loop().run_until_complete(
-                    self._func(*self.args, **self.kwargs)
-                )
-            contents = self._auto_format(result)
-            yield contents
+    def gen_run(self, once: bool = None) -> Iterator[Contents]:
+        '''
+        Return an iterator that runs the Field function and gives its
+        formatted contents each time it is advanced.
+        '''
+        self._resolve_icon()
+        return _FieldTicker(self)
 
     async def run(self, bar: Bar, once: bool) -> None:
         '''
@@ -568,118 +686,145 @@ class Field:
         :type once: :class:`bool`
         '''
         self._check_bar(bar)
+        self._resolve_icon()
         # Do not run fields which have a constant output;
         # only set their bar buffer.
         if self.constant_output is not None:
-            contents = self._format_contents(
-                self.constant_output,
-                self.icon,
-                self.template,
-                self.always_show_icon
-            )
+            contents = self._format(self.constant_output)
             bar._buffers[self.name] = contents
             return
 
-        func = self._callback
+        func = self._func
+        is_async = self.is_async
         running = bar._can_run.is_set
-        clock = time.monotonic
-        using_format_str = (self.template is not None)
+        clock = time.monotonic_ns
+        name = self.name
+        buffers = bar._buffers
         last_val = None
 
         # Use the pre-defined _setupfunc() to gather constant variables
-        # for func() which might only be evaluated at runtime:
-        if self._setupfunc is not None:
+        # for func() which might only be evaluated at runtime.
+        # Synchronous setups have already run in __init__():
+        if not self._setup_done and self._setupfunc is not None:
             try:
-                if asyncio.iscoroutinefunction(self._setupfunc):
-                    setupvars = (
-                        await self._setupfunc(*self.args, **self.kwargs)
-                    )
-                else:
-                    setupvars = self._setupfunc(*self.args, **self.kwargs)
+                setupvars = await self._setupfunc(*self.args, **self.kwargs)
 
             # If _setupfunc raises FailedSetup with a backup value,
             # use it as the field's new constant_output and update the
             # bar's buffer:
             except FailedSetup as e:
                 backup = e.backup
-                contents = self._format_contents(
-                    backup,
-                    self.icon,
-                    self.template,
-                    self.always_show_icon
-                )
+                contents = self._format(backup)
                 self.constant_output = contents
+                self._setup_done = True
                 bar._buffers[self.name] = str(contents)
                 return
 
             # On success, give new values to kwargs to pass to func().
             self.kwargs['setupvars'] = setupvars
+            self._setup_done = True
 
-        # Run at least once at the start to ensure bars have contents:
-        result = await func(*self.args, **self.kwargs)
+        # Run at least once at the start to ensure bars have contents.
+        # Synchronous functions are called directly to avoid the cost
+        # of making and awaiting a new coroutine every cycle:
+        if is_async:
+            result = await func(*self.args, **self.kwargs)
+        else:
+            result = func(*self.args, **self.kwargs)
         last_val = result
-        contents = self._auto_format(result)
+        contents = self._format(result)
         bar._buffers[self.name] = contents
+        last_contents = contents
 
         if self.run_once or once:
             return
 
         if self.clock_align:
             # Sleep until the beginning of the next second.
-            clock = time.time
-            await asyncio.sleep(1 - (clock() % 1))
-        start_time = clock()
-
-        # The main loop:
-        while running():
+            clock = time.time_ns
+            await asyncio.sleep(
+                (_NS_PER_SEC - clock() % _NS_PER_SEC) / _NS_PER_SEC
+            )
+        interval = self.interval
+        interval_ns = round(interval * _NS_PER_SEC)
+        overrides_refresh = self.overrides_refresh
+        put_override = bar._override_queue.put_nowait
+        format_contents = self._format
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
+        deadline = clock() + interval_ns
+        task = None
+
+        # Rather than parking a coroutine in a loop of sleeps, each cycle
+        # is a callback that schedules the next one with call_later().
+        # The chain ends by resolving `finished`.
+
+        def finish(exc: Exception = None) -> None:
+            if finished.done():
+                return
+            if exc is None:
+                finished.set_result(None)
+            else:
+                finished.set_exception(exc)
 
+        def must_stop() -> bool:
+            if not running():
+                return True
             if bar.count:
                 # Stop before running a cycle that could last too long:
                 if (
                     bar._print_countdown == 0
-                    or self.interval > (
+                    or interval > (
                         bar._print_countdown * bar.refresh_rate 
                     )
                 ):
-                    bar._coros.pop(self.name, None)
-                    return
+                    bar._coros.pop(name, None)
+                    return True
+            return False
 
-            result = await func(*self.args, **self.kwargs)
-            # Latency from nonzero execution times causes drift, where
-            # sleeps become out-of-sync and the bar skips field updates.
-            # This is especially noticeable in fields that update
-            # routinely, such as the time.
+        def tick() -> None:
+            nonlocal task
+            if must_stop():
+                finish()
+                return
 
-            # To negate drift, when sleeping until the beginning of the
-            # next cycle, we must also compensate for latency.
-            await asyncio.sleep(
-                # Time until next refresh:
-                self.interval - (
-                    # Get the current latency, which can vary:
-                    clock() % self.interval
-                    # (clock() - start_time) % self.interval  # Preserve offset
-                )
-            )
+            if is_async:
+                task = loop.create_task(func(*self.args, **self.kwargs))
+                task.add_done_callback(tick_done)
+                return
 
-            if result == last_val:
-                continue
-            last_val = result
+            try:
+                result = func(*self.args, **self.kwargs)
+            except Exception as e:
+                finish(e)
+                return
+            update(result)
 
-            if using_format_str:
-                contents = self.template.format(result, icon=self.icon)
+        def tick_done(t: asyncio.Task) -> None:
+            if t.cancelled():
+                finish()
+            elif (exc := t.exception()) is not None:
+                finish(exc)
             else:
-                if self.always_show_icon or result:
-                    contents = self.icon + result
-                else:
-                    contents = result
+                update(t.result())
 
-            bar._buffers[self.name] = contents
+        def publish(result: Contents) -> None:
+            nonlocal last_val, last_contents
+            last_val = result
+
+            contents = format_contents(result)
+
+            # Results can differ while their formatted contents do not:
+            if contents == last_contents:
+                return
+            last_contents = contents
+            buffers[name] = contents
 
             # Send new field contents to the bar's override queue and
             # print a new line between refresh cycles.
-            if self.overrides_refresh:
+            if overrides_refresh:
                 try:
-                    bar._override_queue.put_nowait((self.name, contents))
+                    put_override((name, contents))
 
                 except asyncio.QueueFull:
                     # Since the bar buffer was just updated, do nothing
@@ -688,6 +833,48 @@ class Field:
                     # not, the line will update at the next refresh cycle.
                     pass
 
+        def update(result: Contents) -> None:
+            nonlocal deadline
+            # Errors raised in callbacks never reach the awaiting
+            # coroutine on their own, so pass them on through `finished`:
+            try:
+                # Only format new contents when the result changes:
+                if result != last_val:
+                    publish(result)
+
+                # Latency from nonzero execution times causes drift, where
+                # sleeps become out-of-sync and the bar skips field
+                # updates. This is especially noticeable in fields that
+                # update routinely, such as the time.
+
+                # To negate drift, schedule the next cycle at an absolute
+                # deadline that advances by exactly one interval every
+                # cycle.
+                now = clock()
+                deadline += interval_ns
+                if deadline <= now:
+                    # The function took longer than an interval to run.
+                    # Skip the cycles it missed instead of rushing to
+                    # catch up:
+                    deadline = now + interval_ns
+                self._handle = loop.call_later(
+                    (deadline - now) / _NS_PER_SEC,
+                    tick
+                )
+            except Exception as e:
+                finish(e)
+
+        if must_stop():
+            return
+        self._handle = loop.call_later(interval, tick)
+        try:
+            await finished
+        finally:
+            # Break the chain if this coroutine is cancelled:
+            self._handle.cancel()
+            if task is not None:
+                task.cancel()
+
     def run_threaded(self, bar: Bar, once: bool) -> None:
         '''
         Run a blocking :class:`Field` func and send its output to a
@@ -700,91 +887,104 @@ class Field:
         :type once: :class:`bool`
         '''
         self._check_bar(bar)
+        self._run_threaded_inner(bar, once, self._get_thread_loop(bar))
+
+    def _run_threaded_inner(
+        self,
+        bar: Bar,
+        once: bool,
+        loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        '''
+        The body of :meth:`Field.run_threaded`.
+        The caller must first check `bar` and find `loop` using
+        :meth:`Field._get_thread_loop`.
+
+        :param bar: Send results to this status bar
+        :type bar: :class:`Bar`
+
+        :param once: Run the Field function once
+        :type once: :class:`bool`
+
+        :param loop: The running event loop in which to run async
+            functions, or ``None`` if the Field has none
+        :type loop: :class:`asyncio.AbstractEventLoop` | ``None``
+        '''
+        self._resolve_icon()
 
         # Do not run fields which have a constant output;
         # only set their bar buffer.
         if self.constant_output is not None:
-            contents = self._format_contents(
-                self.constant_output,
-                self.icon,
-                self.template,
-                self.always_show_icon
-            )
+            contents = self._format(self.constant_output)
             bar._buffers[self.name] = contents
             return
 
-        func = self._callback
+        func = self._func
+        is_async = self.is_async
+        # Coroutines run in the bar's shared loop while this thread waits:
+        submit = asyncio.run_coroutine_threadsafe
         running = bar._can_run.is_set
-        clock = time.monotonic
-        using_format_str = (self.template is not None)
+        clock = time.monotonic_ns
+        name = self.name
+        buffers = bar._buffers
         last_val = None
 
-        # If the field's callback is asynchronous,
-        # it must be run in a new event loop.
-        local_loop = asyncio.new_event_loop()
-
         # Use the pre-defined _setupfunc() to gather constant variables
-        # for func() which might only be evaluated at runtime:
-        if self._setupfunc is not None:
+        # for func() which might only be evaluated at runtime.
+        # Synchronous setups have already run in __init__():
+        if not self._setup_done and self._setupfunc is not None:
             try:
-                if asyncio.iscoroutinefunction(self._setupfunc):
-                    setupvars = local_loop.run_until_complete(
-                        self._setupfunc(*self.args, **self.kwargs)
-                    )
-                else:
-                    setupvars = self._setupfunc(*self.args, **self.kwargs)
+                setupvars = submit(
+                    self._setupfunc(*self.args, **self.kwargs),
+                    loop
+                ).result()
 
             # If _setupfunc raises FailedSetup with a backup value,
             # use it as the field's new constant_output and update the
             # bar buffer:
             except FailedSetup as e:
                 backup = e.args[0]
-                contents = self._format_contents(
-                    backup,
-                    self.icon,
-                    self.template,
-                    self.always_show_icon
-                )
+                contents = self._format(backup)
                 self.constant_output = contents
+                self._setup_done = True
                 bar._buffers[self.name] = str(contents)
                 return
 
             # On success, give new values to kwargs to pass to func().
             self.kwargs['setupvars'] = setupvars
+            self._setup_done = True
 
         # Run at least once at the start to ensure bar is not empty:
-        if self.is_async:
-            result = local_loop.run_until_complete(
-                func(*self.args, **self.kwargs)
-            )
+        if is_async:
+            result = submit(func(*self.args, **self.kwargs), loop).result()
         else:
             result = func(*self.args, **self.kwargs)
         last_val = result
-        contents = self._format_contents(
-            result,
-            self.icon,
-            self.template,
-            self.always_show_icon
-        )
+        contents = self._format(result)
         bar._buffers[self.name] = contents
+        last_contents = contents
 
         if self.run_once or once:
-            local_loop.stop()
-            local_loop.close()
             bar._threads.pop(self.name)  #NOTE: Eventually, id(self)
             return
 
-        step = bar._thread_cooldown
-        needed = round(self.interval / step)
-        count = 0
-        first_cycle = True
+        stopped = bar._can_stop.wait
+        format_contents = self._format
+        interval_ns = round(self.interval * _NS_PER_SEC)
+        overrides_refresh = self.overrides_refresh
+        if overrides_refresh:
+            # The queue belongs to the bar's event loop, so items must be
+            # put from that loop's thread:
+            put_override = bar._override_queue.put_nowait
+            thread_put = bar._loop.call_soon_threadsafe
 
         if self.clock_align:
             # Sleep until the beginning of the next second.
-            clock = time.time
-            time.sleep(1 - (clock() % 1))
+            clock = time.time_ns
+            time.sleep((_NS_PER_SEC - clock() % _NS_PER_SEC) / _NS_PER_SEC)
 
-        start_time = clock()
+        # The first cycle runs right away:
+        deadline = clock()
         while running():
 
             if bar.count:
@@ -795,42 +995,33 @@ class Field:
                         bar._print_countdown * bar.refresh_rate 
                     )
                 ):
-                    local_loop.stop()
-                    local_loop.close()
                     bar._coros.pop(self.name, None)
                     return
 
 
-            # Sleep until the next refresh cycle in little steps to
-            # check if the bar has stopped.
-            if count < needed and not first_cycle:
-                count += 1
-
-                # Latency from nonzero execution times causes drift,
-                # where sleeps become out-of-sync and the bar skips
-                # field updates.
-                # This is especially noticeable in fields that update
-                # routinely, such as the time.
-
-                # To negate drift, when sleeping until the beginning of
-                # the next cycle, we must also compensate for latency.
-                time.sleep(
-                    step - (
-                        # Get the current latency, which can vary:
-                        clock() % step
-                        # (clock() - start_time) % step To preserve offset
-                    )
-                )
-                continue
+            # Block until the next refresh cycle, waking early only if
+            # the bar stops:
+            delay = deadline - clock()
+            if delay > 0 and stopped(timeout=delay / _NS_PER_SEC):
+                break
 
-            count = 0
-            if first_cycle:
-                first_cycle = False
+            # Latency from nonzero execution times causes drift,
+            # where sleeps become out-of-sync and the bar skips
+            # field updates.
+            # This is especially noticeable in fields that update
+            # routinely, such as the time.
 
-            if self.is_async:
-                result = local_loop.run_until_complete(
-                    func(*self.args, **self.kwargs)
-                )
+            # To negate drift, sleep until an absolute deadline that
+            # advances by exactly one interval every cycle.
+            deadline += interval_ns
+            now = clock()
+            if deadline <= now:
+                # The function took longer than an interval to run.
+                # Skip the cycles it missed instead of rushing to catch up:
+                deadline = now + interval_ns
+
+            if is_async:
+                result = submit(func(*self.args, **self.kwargs), loop).result()
             else:
                 result = func(*self.args, **self.kwargs)
 
@@ -838,32 +1029,36 @@ class Field:
                 continue
             last_val = result
 
-            if using_format_str:
-                contents = self.template.format(result, icon=self.icon)
-            else:
-                if self.always_show_icon or result:
-                    contents = self.icon + result
-                else:
-                    contents = result
+            contents = format_contents(result)
 
-            bar._buffers[self.name] = contents
+            # Results can differ while their formatted contents do not:
+            if contents == last_contents:
+                continue
+            last_contents = contents
+            buffers[name] = contents
 
             # Send new field contents to the bar's override queue and print a
             # new line between refresh cycles.
-            if self.overrides_refresh:
-                try:
-                    bar._override_queue._loop.call_soon_threadsafe(
-                        bar._override_queue.put_nowait, (self.name, contents)
-                    )
-                except asyncio.QueueFull:
-                    # Since the bar buffer was just updated, do nothing
-                    # if the queue is full. The update may still show
-                    # while the queue handles the current override. If
-                    # not, the line will update at the next refresh cycle.
-                    pass
+            if overrides_refresh:
+                thread_put(self._send_override, put_override, (name, contents))
 
-        local_loop.stop()
-        local_loop.close()
+    @staticmethod
+    def _send_override(
+        put_override: Callable[[tuple[FieldName, Contents]], None],
+        item: tuple[FieldName, Contents]
+    ) -> None:
+        '''
+        Put an item in a bar's override queue from its event loop,
+        ignoring a full queue.
+        '''
+        try:
+            put_override(item)
+        except asyncio.QueueFull:
+            # Since the bar buffer was just updated, do nothing
+            # if the queue is full. The update may still show
+            # while the queue handles the current override. If
+            # not, the line will update at the next refresh cycle.
+            pass
 
     @staticmethod
     def _check_bar(
@@ -873,26 +1068,25 @@ class Field:
         '''
         Check if a bar has the right attributes to use a run() function.
         If these attributes are missing,
-            return ``False`` if `raise_on_fail` is ``True``,
-            or raise :exc:`InvalidBarError` if `raise_on_fail` is ``False``.
+            return ``False`` if `raise_on_fail` is ``False``,
+            or raise :exc:`InvalidBarError` if `raise_on_fail` is ``True``.
+        Otherwise, return ``True``.
 
         :param bar: The status bar object to test
         :type bar: :class:`Bar`
 
         :param raise_on_fail: Raise an exception if `bar` fails the check,
-            defaults to ``False``
+            defaults to ``True``
         :type raise_on_fail: :class:`bool`
 
         :raises: :exc:`InvalidBarError` if the stream fails the test
             and lacks required attributes
         '''
-        required_attrs = (
-            '_buffers',
-            '_can_run',
-            '_override_queue',
-            '_stream',
-        )
-        if not all(hasattr(bar, a) for a in required_attrs):
+        try:
+            # Touch each required attribute once:
+            bar._buffers, bar._can_run, bar._can_stop
+            bar._override_queue, bar._stream
+        except AttributeError:
             if not raise_on_fail:
                 return False
             raise InvalidBarError(
@@ -902,6 +1096,22 @@ class Field:
             ) from None
         return True
 
+    def _get_thread_loop(
+        self,
+        bar: Bar
+    ) -> asyncio.AbstractEventLoop | None:
+        '''
+        Return the event loop a threaded :class:`Field` should use to run
+        its async function or setup, or ``None`` if it needs no loop.
+        Such Fields all share one loop per bar.
+
+        :param bar: The status bar providing the loop
+        :type bar: :class:`Bar`
+        '''
+        if self.is_async or self._setup_is_async:
+            return bar._get_thread_loop()
+        return None
+
     def make_thread(self, bar: Bar, run_once: bool) -> None:
         '''
         Return a thread that runs the :class:`Field`'s callback.
@@ -912,10 +1122,73 @@ class Field:
         :param once: Run the Field function once
         :type once: :class:`bool`
         '''
+        # Check the bar and find the thread's event loop up front
+        # rather than in the new thread:
+        self._check_bar(bar)
+        loop = self._get_thread_loop(bar)
         thread = threading.Thread(
-            target=self.run_threaded,
-            args=(bar, run_once),
+            target=self._run_threaded_inner,
+            args=(bar, run_once, loop),
             name=self.name  # #NOTE Eventually, id(self)
         )
         return thread
 
+
+class _FieldTicker:
+    '''
+    An iterator returned by :meth:`Field.gen_run`.
+    Whether the Field function is async is decided once, so each step
+    is a single call rather than the resumption of a generator.
+    Async Fields run in an event loop owned by the ticker.
+
+    :param field: The Field to run
+    :type field: :class:`Field`
+    '''
+    __slots__ = ('_next', '_loop')
+
+    def __init__(self, field: Field) -> None:
+        self._loop = None
+        if field.is_async or field._setup_is_async:
+            # Reuse one event loop rather than making one every cycle:
+            self._loop = asyncio.new_event_loop()
+        try:
+            field._do_setup(loop=self._loop)
+        except BaseException:
+            self.close()
+            raise
+
+        fmt = field._format
+        func = field._func
+        args = field.args
+        kwargs = field.kwargs
+
+        # Do not run fields which have a constant output:
+        if field.constant_output is not None:
+            contents = fmt(field.constant_output)
+            self._next = lambda: contents
+        elif field.is_async:
+            run = self._loop.run_until_complete
+            self._next = lambda: fmt(run(func(*args, **kwargs)))
+            return
+        else:
+            self._next = lambda: fmt(func(*args, **kwargs))
+        # Only the setup needed the loop, if any:
+        self.close()
+
+    def close(self) -> None:
+        '''
+        Close the ticker's event loop, if it has one.
+        '''
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> Contents:
+        return self._next()
+
@@ -19,6 +19,7 @@ import shlex
 import time
 from asyncio import subprocess as aiosp
 from datetime import datetime
+from functools import lru_cache
 from string import Formatter
 
 from .errors import InvalidArgError
@@ -50,6 +51,24 @@ else:
     import psutil
 
 
+# Compile patterns once rather than every time a Field runs:
+_AMIXER_STATE = re.compile(r'\[(\d+)%\] \[(\w+)\]')
+'''Matches the volume percentage and on/off state in amixer output.'''
+
+
+@lru_cache(maxsize=16)
+def _parse_conditional(
+    fmt: FormatStr,
+    sep: str
+) -> tuple[tuple[str], tuple[tuple]]:
+    '''
+    Parse a conditional format string once per distinct `fmt` and `sep`
+    and return its field names and groups.
+    '''
+    conditional = ConditionalFormatStr(fmt, sep)
+    return conditional.fnames, conditional.groups
+
+
 async def get_audio_volume(
     fmt: FormatStr = "{:02.0f}{state}",
     *args, **kwargs
@@ -60,19 +79,15 @@ async def get_audio_volume(
     '''
 ##    '''Returns system audio volume from ALSA amixer. SIGUSR1 is used to
 ##    notify the thread of volume changes from button presses.'''
-    pat = re.compile(r'.*\[(\d+)%\] \[(\w+)\]')
-
     cmd = await aiosp.create_subprocess_shell(
         "amixer sget Master",
         stdout=aiosp.PIPE
     )
     out, err = await cmd.communicate()
-    state_list = (l.strip() for l in reversed(out.decode().splitlines()))
 
+    # Scan the whole output in one pass rather than line by line:
     pcts, states = zip(*(
-        m.groups()
-        for l in state_list
-        if (m := pat.match(l))
+        m.groups() for m in _AMIXER_STATE.finditer(out.decode())
     ))
     avg_pct = sum(int(p) for p in pcts) // len(pcts)
     is_on = any(s == 'on' for s in states)
@@ -480,11 +495,12 @@ async def get_uptime(
     secs = time.time() - psutil.boot_time()
 
     if not setupvars:
-        conditional = ConditionalFormatStr(fmt, sep)
+        # Without a setup, avoid parsing `fmt` again at every refresh:
+        fnames, groups = _parse_conditional(fmt, sep)
 
         setupvars = {
-            'fnames': conditional.fnames,
-            'groups': conditional.groups,
+            'fnames': fnames,
+            'groups': groups,
             'sep': sep,
         }
     lookup_table = ElapsedTime.in_desired_units(secs, setupvars['fnames'])
@@ -164,6 +164,9 @@ class FmtStrStructure(tuple[FormatterFieldSig]):
     into a tuple of :class:`FormatterFieldSig`,
     one for each replacement field.
     '''
+    # Like the tuple it extends, carry no per-instance __dict__:
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return type(self).__name__ + tuple.__repr__(self)
 
@@ -384,25 +387,28 @@ class ConditionalFormatStr:
         if sep is None:
             sep = self.sep
 
-        sections = []
+        groups = []
         # Split fmt for parsing, but join any format specs that get broken:
-        pieces = (p for p in self.fmt.split(sep))
+        pieces = iter(self.fmt.split(sep))
+        parse = Formatter().parse
 
-        def _is_malformed(piece: FormatStr):
-            '''Return whether a format string is malformed.'''
+        def _try_parse(piece: FormatStr):
+            '''
+            Return the parsed fields of a format string,
+            or ``None`` if it is malformed.
+            '''
             try:
-                tuple(Formatter().parse(piece))
+                return tuple(parse(piece))
             except ValueError:
-                return True
-            else:
-                return False
+                return None
 
         try:
             for piece in pieces:
-                while _is_malformed(piece):
+                # Keep the result of the check instead of parsing again:
+                while (parsed := _try_parse(piece)) is None:
                     # Raise StopIteration if a valid field end is not found:
                     piece = sep.join((piece, next(pieces)))
-                sections.append(piece)
+                groups.append(parsed)
 
         except StopIteration:
             exc = make_error_message(
@@ -414,10 +420,7 @@ class ConditionalFormatStr:
             )
             raise exc from None
 
-        groups = tuple(
-            tuple(Formatter().parse(section))
-            for section in sections
-        )
+        groups = tuple(groups)
 
         fnames = tuple(
             name
@@ -584,6 +587,10 @@ class ElapsedTime:
             hide_meme.pop('femtofortnights', None)  # Shhh, it's a secret.
             return hide_meme
 
+    # Unit names from largest to smallest, gathered before the mapping
+    # gets the stack-inspecting __iter__() below:
+    _ordered_units = tuple(conversions_to_secs)
+
     conversions_to_secs = dict(conversions_to_secs)
 
     @classmethod
@@ -638,7 +645,8 @@ class ElapsedTime:
             raise exc
 
         # Get the units in order of largest first:
-        ordered = tuple(u for u in cls.conversions_to_secs if u in units)
+        wanted = set(units)
+        ordered = tuple(u for u in cls._ordered_units if u in wanted)
 
         table = {}
         if len(ordered) == 1:
@@ -682,18 +690,21 @@ def format_uptime(
         :class:`FormatterFieldSig` based on the locations of `separator`
     :type groups: :class:`Iterable`[:class:`Iterable`[:class:`FormatterFieldSig`]]
     '''
+    # This runs at every refresh, so look up bound methods only once:
+    get = namespace.get
     newgroups = []
+    add_group = newgroups.append
     for i, group in enumerate(groups):
         if not group:
             # Just an extraneous separator.
-            newgroups.append(())
+            add_group(())
             continue
 
         newgroup = []
 
         for maybe_field in group:
             # Skip groups that should appear blank:
-            if (val := namespace.get(maybe_field[1])) is not None and val < 1:
+            if (val := get(maybe_field[1])) is not None and val < 1:
                 break
 
             buf = ""
@@ -719,18 +730,18 @@ def format_uptime(
                         except TypeError:
                             buf += str(val)
 
-                case _:
+                case weird:
                     raise ValueError(
                         f"\n"
                         f"Invalid structure in tuple\n"
                         f"  {i} {maybe_field}:\n"
-                        f"  {spam!r}"
+                        f"  {weird!r}"
                     )
 
             if buf:
                 newgroup.append(buf)
         if newgroup:
-            newgroups.append(newgroup)
+            add_group(newgroup)
 
     # Join everything.
     return sep.join(''.join(g) for g in newgroups)
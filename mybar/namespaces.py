@@ -7,7 +7,6 @@ __all__ = (
 )
 
 
-from ast import Dict, List
 from os import PathLike
 
 from ._types import (
@@ -62,7 +61,7 @@ class FieldSpec(FieldConfigSpec, total=False):
     setup: Callable[P, P.kwargs]
     bar: Bar
 
-    unserializable = ('func', 'setup', 'bar')
+    unserializable = frozenset({'func', 'setup', 'bar'})
 
 
 class BarSpec(TypedDict, total=False):
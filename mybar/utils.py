@@ -72,17 +72,21 @@ def join_options(
     return sep.join(opts)
 
 
+_TRUTHY = frozenset("true t yes y on 1".split())
+_FALSY = frozenset("false f no n off 0".split())
+
+
 def str_to_bool(value: str | bool, /) -> bool:
     '''Returns `True` or `False` bools for truthy or falsy strings.'''
     if isinstance(value, bool):
         return value
     value = str(value)
-    truthy = "true t yes y on 1".split()
-    falsy = "false f no n off 0".split()
     pattern = value.lower()
-    if pattern not in truthy + falsy:
-        raise ValueError(f"Invalid argument: {value!r}")
-    return (pattern in truthy or not pattern in falsy)
+    if pattern in _TRUTHY:
+        return True
+    if pattern in _FALSY:
+        return False
+    raise ValueError(f"Invalid argument: {value!r}")
 
 
 def recursive_scrub(
@@ -101,31 +105,23 @@ def recursive_scrub(
     if not inplace:
         new = deepcopy(obj)
 
-    def clean(o):
+    # Walk nested containers with a stack instead of recursing:
+    stack = [new]
+    while stack:
+        o = stack.pop()
         if isinstance(o, list):
-            i = 0
-            while i < len(o):
-                elem = o[i]
-                if test(elem):
-                    del o[i]
-                    continue
-                else:
-                    clean(elem)
-                i += 1
+            # Rebuild the list in place rather than deleting one by one:
+            o[:] = [elem for elem in o if not test(elem)]
+            stack.extend(o)
 
         elif isinstance(o, dict):
-            for key, val in tuple(o.items()):
+            for key in tuple(o):
                 if test(key):
                     del o[key]
                 # elif test(val):
                     # del o[key]
-                else:
-                    clean(val)
-
-        elif test(o):
-            del o
+            stack.extend(o.values())
 
-    clean(new)
     return new
 
 
@@ -232,17 +228,15 @@ def process_nested_dict(
     '''
     nodes = []
     vals = []
+    while isinstance(dct, Mapping) and len(dct) == 1:
+        # An attribute. Descend into it without recursing:
+        (a, dct), = dct.items()
+        roots.append(a)
+
     if not isinstance(dct, Mapping):
         # An assignment.
         return ([roots], [dct])
 
-    if len(dct) == 1:
-        # An attribute.
-        for a, v in dct.items():
-            roots.append(a)
-            result = process_nested_dict(v, roots, descended)
-            return result
-
     descended = 0  # Start of a tree.
     for attr, v in dct.items():
         roots.append(attr)
@@ -278,9 +272,17 @@ def nested_update(
         # Replace the old value with the new:
         return upd
 
-    for k, v in upd.items():
-        if isinstance(v, Mapping):
-            v = nested_update(orig.get(k, {}), v)
-        orig[k] = v
+    # Merge one level at a time from a stack instead of recursing:
+    stack = [(orig, upd)]
+    while stack:
+        dest, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, Mapping):
+                inner = dest.get(k, {})
+                if isinstance(inner, Mapping):
+                    # Merge into the existing mapping later:
+                    stack.append((inner, v))
+                    v = inner
+            dest[k] = v
     return orig
 
@@ -0,0 +1,41 @@
+import io
+import itertools
+import threading
+import unittest
+
+from mybar import Bar, Field
+
+
+class TestFieldRun(unittest.TestCase):
+
+    def test_format_error_reaches_bar_run(self):
+        # The first result formats fine, but later ones do not:
+        results = itertools.chain(['ok'], itertools.repeat(1))
+        field = Field(
+            name='bad',
+            func=lambda: next(results),
+            template='{icon}{:s}',
+            icon='X',
+            interval=0.1,
+        )
+        stream = io.StringIO()
+        bar = Bar(fields=[field], refresh=0.1, count=5, stream=stream)
+
+        errors = []
+        def run():
+            try:
+                bar.run()
+            except Exception as e:
+                errors.append(e)
+
+        # Guard against the bar hanging instead of raising:
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive(), "Bar.run() did not return")
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+
+if __name__ == '__main__':
+    unittest.main()